@@ -8,4 +8,4 @@ class ClassroomSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Classroom
-        exclude = ("deleted", "school", "external_id")
+        exclude = ("deleted", "school", "external_id", "program_director")
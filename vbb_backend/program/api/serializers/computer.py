@@ -10,4 +10,4 @@ class ComputerSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Computer
-        exclude = ("deleted", "program", "external_id")
+        exclude = ("deleted", "program", "external_id", "program_director")
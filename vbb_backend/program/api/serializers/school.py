@@ -8,4 +8,4 @@ class SchoolSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = School
-        exclude = ("deleted", "program", "external_id")
+        exclude = ("deleted", "program", "external_id", "program_director")
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from datetime import datetime, timedelta
+from psycopg2.extras import DateTimeTZRange
 from vbb_backend.program.models import Slot
 from rest_framework.exceptions import ValidationError
 
@@ -44,10 +45,10 @@ class SlotSerializer(serializers.ModelSerializer):
         end_hour = attrs.pop("end_hour")
         end_minute = attrs.pop("end_minute")
 
-        schedule_start = Slot.DEAFULT_INIT_DATE + timedelta(
+        schedule_start = Slot.DEFAULT_INIT_DATE + timedelta(
             days=start_day_of_week, hours=start_hour, minutes=start_minute
         )
-        schedule_end = Slot.DEAFULT_INIT_DATE + timedelta(
+        schedule_end = Slot.DEFAULT_INIT_DATE + timedelta(
             days=end_day_of_week, hours=end_hour, minutes=end_minute
         )
 
@@ -57,8 +58,7 @@ class SlotSerializer(serializers.ModelSerializer):
             )
         validated_data = super().validate(attrs)
 
-        validated_data["schedule_start"] = schedule_start
-        validated_data["schedule_end"] = schedule_end
+        validated_data["schedule"] = DateTimeTZRange(schedule_start, schedule_end)
         return validated_data
 
     class Meta:
@@ -67,8 +67,8 @@ class SlotSerializer(serializers.ModelSerializer):
             "deleted",
             "computer",
             "external_id",
-            "schedule_start",
-            "schedule_end",
+            "schedule",
+            "program_director",
         )
         read_only_fields = (
             "is_mentor_assigned",
@@ -24,7 +24,7 @@ class ClassroomViewSet(ModelViewSet):
         if user.is_superuser:
             pass
         elif user.user_type in [UserTypeEnum.HEADMASTER.value]:
-            queryset = queryset.filter(school__program__program_director=user)
+            queryset = queryset.filter(program_director=user)
         else:
             raise PermissionDenied()
         return queryset
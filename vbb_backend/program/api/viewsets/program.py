@@ -6,11 +6,12 @@ from rest_framework.viewsets import ModelViewSet
 
 from vbb_backend.program.api.serializers.program import ProgramSerializer
 from vbb_backend.program.models import Program
+from vbb_backend.program.querysets import get_optimized_queryset
 from vbb_backend.users.models import UserTypeEnum
 
 
 class ProgramViewSet(ModelViewSet):
-    queryset = Program.objects.all()
+    queryset = get_optimized_queryset(Program)
     permission_classes = [IsAuthenticated, DRYPermissions]
     serializer_class = ProgramSerializer
     lookup_field = "external_id"
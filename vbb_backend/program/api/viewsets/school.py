@@ -25,7 +25,7 @@ class SchoolViewSet(ModelViewSet):
         if user.is_superuser:
             pass
         elif user.user_type in [UserTypeEnum.HEADMASTER.value]:
-            queryset = queryset.filter(program__program_director=user)
+            queryset = queryset.filter(program_director=user)
         else:
             raise PermissionDenied()
         return queryset
@@ -33,7 +33,7 @@ class SlotViewSet(ModelViewSet):
         if user.is_superuser:
             pass
         elif user.user_type in [UserTypeEnum.HEADMASTER.value]:
-            queryset = queryset.filter(computer__program__program_director=user)
+            queryset = queryset.filter(program_director=user)
         else:
             raise PermissionDenied()
         return queryset
@@ -50,10 +50,8 @@ class SlotViewSet(ModelViewSet):
     @action(detail=True, methods=["get"])
     def mentor(self, request, pk):
         slot = self.get_object()
-        rule_object = SessionRule.objects.filter(slot=slot)
-        if rule_object.exists():
-            return Response(
-                SessionRuleSerializer(rule_object.order_by("-start").latest()).data
-            )
+        rule_object = SessionRule.objects.filter(slot=slot).order_by("-start").first()
+        if rule_object:
+            return Response(SessionRuleSerializer(rule_object).data)
         else:
             return Response({"mentor": "Not Found"}, status=status.HTTP_404_NOT_FOUND)
@@ -6,11 +6,12 @@ from rest_framework.viewsets import ModelViewSet
 
 from vbb_backend.program.api.serializers.student_slot import StudentSlotSerializer
 from vbb_backend.program.models import Program, Slot, StudentSlotAssociation
+from vbb_backend.program.querysets import get_optimized_queryset
 from vbb_backend.users.models import UserTypeEnum
 
 
 class StudentSlotViewSet(ModelViewSet):
-    queryset = StudentSlotAssociation.objects.all()
+    queryset = get_optimized_queryset(StudentSlotAssociation)
     permission_classes = [IsAuthenticated, DRYPermissions]
     serializer_class = StudentSlotSerializer
     lookup_field = "external_id"
@@ -23,7 +24,7 @@ class StudentSlotViewSet(ModelViewSet):
         if user.is_superuser:
             pass
         elif user.user_type in [UserTypeEnum.HEADMASTER.value]:
-            queryset = queryset.filter(slot__computer__program__program_director=user)
+            queryset = queryset.filter(slot__program_director=user)
         else:
             raise PermissionDenied()
         return queryset
@@ -7,7 +7,6 @@ class ProgramConfig(AppConfig):
     verbose_name = _("Program")
 
     def ready(self):
-        try:
-            import vbb_backend.program.signals  # noqa F401
-        except ImportError:
-            pass
+        # Keeps the denormalized program director and the permission cache in sync,
+        # a failing import must not go unnoticed
+        import vbb_backend.program.signals  # noqa F401
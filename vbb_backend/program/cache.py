@@ -0,0 +1,62 @@
+"""
+Short lived read through cache for objects looked up by external_id in the create permission
+checks. Entries are invalidated on save and delete by the receivers in
+vbb_backend.program.signals, once the surrounding transaction commits (requests run with
+ATOMIC_REQUESTS).
+
+Each object has a version key and entries are stored under the current version. Invalidation
+replaces the version instead of deleting the entry, so a lookup that read the row before the
+commit and writes it to the cache afterwards stores it under a version nobody reads anymore.
+"""
+from uuid import UUID, uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+CACHE_TIMEOUT = 60  # Seconds
+
+
+def get_cache_key(model, external_id):
+    return f"{model._meta.label_lower}:{UUID(str(external_id))}"
+
+
+def get_version(key):
+    version_key = f"{key}:version"
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid4().hex, None)
+        version = cache.get(version_key)
+    return version
+
+
+def get_by_external_id(model, external_id):
+    try:
+        key = get_cache_key(model, external_id)
+    except ValueError:
+        # Not a UUID, let the query raise the usual error
+        return model.objects.get(external_id=external_id)
+
+    # The version has to be read before the row, see the module docstring
+    version = get_version(key)
+    if version is None:
+        # Cache unavailable
+        return model.objects.get(external_id=external_id)
+
+    versioned_key = f"{key}:{version}"
+    obj = cache.get(versioned_key)
+    if obj is None:
+        obj = model.objects.get(external_id=external_id)
+        cache.set(versioned_key, obj, CACHE_TIMEOUT)
+    return obj
+
+
+def invalidate(model, *external_ids):
+    keys = [get_cache_key(model, external_id) for external_id in external_ids]
+    if keys:
+        # Replacing the version before the commit would let a concurrent lookup cache the old
+        # row under the new version
+        transaction.on_commit(
+            lambda: cache.set_many(
+                {f"{key}:version": uuid4().hex for key in keys}, None
+            )
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:21
+
+import django.contrib.postgres.constraints
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+import django.db.models.expressions
+import vbb_backend.program.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0006_auto_20201210_1114'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.AddConstraint(
+            model_name='slot',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(deleted=False), expressions=[('computer', '='), (vbb_backend.program.models.TsTzRange(django.db.models.expressions.F('schedule_start'), django.db.models.expressions.F('schedule_end')), '&&')], name='slot_no_overlap'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0007_slot_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='program',
+            name='default_language',
+            field=models.CharField(choices=[('ENGLISH', 'English')], max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='slot',
+            name='language',
+            field=models.CharField(choices=[('ENGLISH', 'English')], max_length=254),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+
+def populate_program_director(apps, schema_editor):
+    Program = apps.get_model("program", "Program")
+    School = apps.get_model("program", "School")
+    Classroom = apps.get_model("program", "Classroom")
+    Computer = apps.get_model("program", "Computer")
+    Slot = apps.get_model("program", "Slot")
+
+    program_director = Program.objects.filter(pk=OuterRef("program_id")).values(
+        "program_director_id"
+    )
+    School.objects.update(program_director_id=Subquery(program_director))
+    Computer.objects.update(program_director_id=Subquery(program_director))
+    Classroom.objects.update(
+        program_director_id=Subquery(
+            School.objects.filter(pk=OuterRef("school_id")).values(
+                "program_director_id"
+            )
+        )
+    )
+    Slot.objects.update(
+        program_director_id=Subquery(
+            Computer.objects.filter(pk=OuterRef("computer_id")).values(
+                "program_director_id"
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('program', '0009_language_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='classroom',
+            name='program_director',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='computer',
+            name='program_director',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='school',
+            name='program_director',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='program_director',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(populate_program_director, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0010_denormalize_program_director'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['library', 'is_available'], name='book_library_available_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='computer',
+            index=models.Index(fields=['program', 'computer_number'], name='computer_program_number_idx'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:30
+
+from django.db import migrations, models
+
+
+SCHEDULE_PARTS = (
+    "start_day_of_the_week",
+    "end_day_of_the_week",
+    "start_hour",
+    "end_hour",
+    "start_minute",
+    "end_minute",
+)
+
+
+def populate_schedule_parts(apps, schema_editor):
+    Slot = apps.get_model("program", "Slot")
+    for slot in Slot.objects.all().iterator():
+        slot.start_day_of_the_week = slot.schedule_start.weekday()
+        slot.end_day_of_the_week = slot.schedule_end.weekday()
+        slot.start_hour = slot.schedule_start.hour
+        slot.end_hour = slot.schedule_end.hour
+        slot.start_minute = slot.schedule_start.minute
+        slot.end_minute = slot.schedule_end.minute
+        slot.save(update_fields=SCHEDULE_PARTS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0011_book_computer_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slot',
+            name='start_day_of_the_week',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='end_day_of_the_week',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='start_hour',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='end_hour',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='start_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='end_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_schedule_parts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:24
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0012_slot_schedule_parts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='isbn',
+            field=models.CharField(blank=True, max_length=13, null=True, validators=[django.core.validators.RegexValidator('^(\\d{9}[\\dX]|\\d{13})$', 'Enter a valid ISBN-10 or ISBN-13')]),
+        ),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted', False), ('isbn__isnull', False)), fields=('isbn',), name='book_isbn_unique'),
+        ),
+    ]
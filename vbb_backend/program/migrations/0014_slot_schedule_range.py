@@ -0,0 +1,78 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:40
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.db import migrations, models
+from django.db.models import F, Func, Q
+
+import vbb_backend.program.models
+
+
+def populate_schedule(apps, schema_editor):
+    Slot = apps.get_model("program", "Slot")
+    Slot.objects.update(
+        schedule=vbb_backend.program.models.TsTzRange(
+            F("schedule_start"), F("schedule_end")
+        )
+    )
+
+
+def populate_schedule_bounds(apps, schema_editor):
+    Slot = apps.get_model("program", "Slot")
+    Slot.objects.update(
+        schedule_start=Func(
+            F("schedule"), function="LOWER", output_field=models.DateTimeField()
+        ),
+        schedule_end=Func(
+            F("schedule"), function="UPPER", output_field=models.DateTimeField()
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0013_book_isbn_char'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slot',
+            name='schedule',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(null=True),
+        ),
+        migrations.RunPython(populate_schedule, migrations.RunPython.noop),
+        migrations.RemoveConstraint(
+            model_name='slot',
+            name='slot_no_overlap',
+        ),
+        # Kept nullable before the drop so that unapplying can re-add and backfill them
+        migrations.AlterField(
+            model_name='slot',
+            name='schedule_start',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='slot',
+            name='schedule_end',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, populate_schedule_bounds),
+        migrations.RemoveField(
+            model_name='slot',
+            name='schedule_end',
+        ),
+        migrations.RemoveField(
+            model_name='slot',
+            name='schedule_start',
+        ),
+        migrations.AlterField(
+            model_name='slot',
+            name='schedule',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+        ),
+        migrations.AddConstraint(
+            model_name='slot',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=Q(deleted=False), expressions=[('computer', '='), ('schedule', '&&')], name='slot_no_overlap'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:50
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_minute_of_week(apps, schema_editor):
+    Slot = apps.get_model("program", "Slot")
+    Slot.objects.update(
+        start_minute_of_week=(F("start_day_of_the_week") * 24 + F("start_hour")) * 60
+        + F("start_minute"),
+        end_minute_of_week=(F("end_day_of_the_week") * 24 + F("end_hour")) * 60
+        + F("end_minute"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0014_slot_schedule_range'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slot',
+            name='start_minute_of_week',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='end_minute_of_week',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_minute_of_week, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0015_slot_minute_of_week'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='library',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='library',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='school',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='school',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+    ]
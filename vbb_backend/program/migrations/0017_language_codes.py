@@ -0,0 +1,38 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:27
+
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    Program = apps.get_model("program", "Program")
+    Slot = apps.get_model("program", "Slot")
+    Program.objects.filter(default_language="ENGLISH").update(default_language="EN")
+    Slot.objects.filter(language="ENGLISH").update(language="EN")
+
+
+def backwards(apps, schema_editor):
+    Program = apps.get_model("program", "Program")
+    Slot = apps.get_model("program", "Slot")
+    Program.objects.filter(default_language="EN").update(default_language="ENGLISH")
+    Slot.objects.filter(language="EN").update(language="ENGLISH")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program', '0016_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+        migrations.AlterField(
+            model_name='program',
+            name='default_language',
+            field=models.CharField(choices=[('EN', 'English')], default='EN', max_length=2),
+        ),
+        migrations.AlterField(
+            model_name='slot',
+            name='language',
+            field=models.CharField(choices=[('EN', 'English')], default='EN', max_length=2),
+        ),
+    ]
@@ -1,22 +1,34 @@
-import enum
-from datetime import datetime
-from django.db import models
+from datetime import datetime, timezone
+from types import MappingProxyType
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
+from django.core.validators import RegexValidator
+from django.db import IntegrityError, models, transaction
+from django.db.models import Func, Q
 from django.db.models.base import Model
 from rest_framework.exceptions import ValidationError
 
+from vbb_backend.program.cache import get_by_external_id
 from vbb_backend.utils.models.base import BaseUUIDModel
 from vbb_backend.users.models import UserTypeEnum
 
 import pytz
 
+# First Monday of the year 2000 in UTC, slot schedules are stored relative to this week
+_SLOT_EPOCH = datetime(2000, 1, 3, tzinfo=timezone.utc)
+
 TIMEZONES = tuple(zip(pytz.all_timezones, pytz.all_timezones))
 
 
-class LanguageEnum(enum.Enum):
-    ENGLISH = "ENGLISH"
+class TsTzRange(Func):
+    """Builds a tstzrange from two timestamps, referenced by migrations"""
+
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
 
 
-LanguageChoices = [(e.value, e.name) for e in LanguageEnum]
+class Language(models.TextChoices):
+    ENGLISH = "EN", "English"
 
 
 class Program(BaseUUIDModel):
@@ -47,9 +59,13 @@ class Program(BaseUUIDModel):
         "users.User", on_delete=models.SET_NULL, null=True
     )
     village_info_link = models.CharField(max_length=200, null=True, blank=True)
-    default_language = models.CharField(max_length=254, choices=LanguageChoices)
+    default_language = models.CharField(
+        max_length=2, choices=Language.choices, default=Language.ENGLISH
+    )
 
-    ACCESS_CONTROL = {"program_director": [UserTypeEnum.ADVISOR.value]}
+    ACCESS_CONTROL = MappingProxyType(
+        {"program_director": frozenset({UserTypeEnum.ADVISOR.value})}
+    )  # Attribute -> user types allowed to set it, read only
 
     @staticmethod
     def has_create_permission(request):
@@ -64,7 +80,7 @@ class Program(BaseUUIDModel):
         return True  # User Queryset Filtering Here
 
     def has_object_write_permission(self, request):
-        return request.user.is_superuser or request.user == self.program_director
+        return request.user.is_superuser or request.user.id == self.program_director_id
 
     def has_object_update_permission(self, request):
         return self.has_object_write_permission(request)
@@ -92,8 +108,16 @@ class School(BaseUUIDModel):  # LATER keep track of student attendance, and grad
 
     name = models.CharField(max_length=40, blank=False)
     program = models.ForeignKey(Program, on_delete=models.SET_NULL, null=True)
-    longitude = models.DecimalField(max_digits=9, decimal_places=6)
-    latitude = models.DecimalField(max_digits=9, decimal_places=6)
+    program_director = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=True,
+    )  # Denormalized from program, kept in sync by signals
+    longitude = models.FloatField()
+    latitude = models.FloatField()
     # link to 3rd party LMS ?
     # has studens (students have foreign keys back to school)
     # has a headmaster (usually the same as program director) ("has" means these things have foreign keys back to school)
@@ -102,10 +126,12 @@ class School(BaseUUIDModel):  # LATER keep track of student attendance, and grad
 
     @staticmethod
     def has_create_permission(request):
-        program = Program.objects.get(
-            external_id=request.parser_context["kwargs"]["program_external_id"]
+        program = get_by_external_id(
+            Program, request.parser_context["kwargs"]["program_external_id"]
+        )
+        return (
+            request.user.is_superuser or request.user.id == program.program_director_id
         )
-        return request.user.is_superuser or request.user == program.program_director
 
     @staticmethod
     def has_write_permission(request):
@@ -116,9 +142,7 @@ class School(BaseUUIDModel):  # LATER keep track of student attendance, and grad
         return True  # User Queryset Filtering Here
 
     def has_object_write_permission(self, request):
-        return (
-            request.user.is_superuser or request.user == self.program.program_director
-        )
+        return request.user.is_superuser or request.user.id == self.program_director_id
 
     def has_object_update_permission(self, request):
         return self.has_object_write_permission(request)
@@ -142,14 +166,22 @@ class Classroom(BaseUUIDModel):
 
     name = models.CharField(max_length=40, null=True, blank=True)
     school = models.ForeignKey(School, on_delete=models.SET_NULL, null=True)
+    program_director = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=True,
+    )  # Denormalized from school, kept in sync by signals
 
     @staticmethod
     def has_create_permission(request):
-        school = School.objects.get(
-            external_id=request.parser_context["kwargs"]["school_external_id"]
+        school = get_by_external_id(
+            School, request.parser_context["kwargs"]["school_external_id"]
         )
         return (
-            request.user.is_superuser or request.user == school.program.program_director
+            request.user.is_superuser or request.user.id == school.program_director_id
         )
 
     @staticmethod
@@ -161,10 +193,7 @@ class Classroom(BaseUUIDModel):
         return True  # User Queryset Filtering Here
 
     def has_object_write_permission(self, request):
-        return (
-            request.user.is_superuser
-            or request.user == self.school.program.program_director
-        )
+        return request.user.is_superuser or request.user.id == self.program_director_id
 
     def has_object_update_permission(self, request):
         return self.has_object_write_permission(request)
@@ -183,8 +212,8 @@ class Library(BaseUUIDModel):
 
     name = models.CharField(max_length=40, null=True, blank=True)
     program = models.ForeignKey(Program, on_delete=models.SET_NULL, null=True)
-    longitude = models.DecimalField(max_digits=9, decimal_places=6)
-    latitude = models.DecimalField(max_digits=9, decimal_places=6)
+    longitude = models.FloatField()
+    latitude = models.FloatField()
 
     class Meta:
         verbose_name_plural = "Libraries"
@@ -197,7 +226,7 @@ class Book(BaseUUIDModel):
     """
     This Model Represents a book that can be checked out from a VBB Library
         title: the title of the book
-        isbn: the 13 digit identifying barcode on the back of the book (TODO: may need to adjustthis to allow for ISBN-9)
+        isbn: the 10 or 13 digit identifying barcode on the back of the book, stored as a string to keep leading zeros
         library: the library the book belongs to
         reading_level: the grade level this book is associated with (ie 0 is kindergarten, 12 is 12th grade level, etc)
         is_available: set to true when the book is not lended to anyone and is available at the library
@@ -205,10 +234,31 @@ class Book(BaseUUIDModel):
 
     library = models.ForeignKey(Library, on_delete=models.SET_NULL, null=True)
     title = models.CharField(max_length=40, null=True, blank=True)
-    isbn = models.IntegerField(null=True, blank=True)
+    isbn = models.CharField(
+        max_length=13,
+        null=True,
+        blank=True,
+        validators=[
+            RegexValidator(r"^(\d{9}[\dX]|\d{13})$", "Enter a valid ISBN-10 or ISBN-13")
+        ],
+    )
     reading_level = models.IntegerField(null=True, blank=True)
     is_available = models.BooleanField(default=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["isbn"],
+                condition=Q(isbn__isnull=False, deleted=False),
+                name="book_isbn_unique",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["library", "is_available"], name="book_library_available_idx"
+            )
+        ]
+
 
 class Checkout(BaseUUIDModel):
     """
@@ -232,21 +282,37 @@ class Computer(BaseUUIDModel):
         Program,
         on_delete=models.PROTECT,
     )
+    program_director = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=True,
+    )  # Denormalized from program, kept in sync by signals
     computer_number = models.IntegerField(null=True)
     computer_email = models.EmailField(max_length=70, null=True)
     room_id = models.CharField(max_length=100, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["program", "computer_number"],
+                name="computer_program_number_idx",
+            )
+        ]
+
     def __str__(self):
-        return (
-            f"{str(self.program)} {str(self.computer_number)} + ({self.computer_email})"
-        )
+        return f"{self.program_id} {self.computer_number} ({self.computer_email})"
 
     @staticmethod
     def has_create_permission(request):
-        program = Program.objects.get(
-            external_id=request.parser_context["kwargs"]["program_external_id"]
+        program = get_by_external_id(
+            Program, request.parser_context["kwargs"]["program_external_id"]
+        )
+        return (
+            request.user.is_superuser or request.user.id == program.program_director_id
         )
-        return request.user.is_superuser or request.user == program.program_director
 
     @staticmethod
     def has_write_permission(request):
@@ -257,9 +323,7 @@ class Computer(BaseUUIDModel):
         return True  # User Queryset Filtering Here
 
     def has_object_write_permission(self, request):
-        return (
-            request.user.is_superuser or request.user == self.program.program_director
-        )
+        return request.user.is_superuser or request.user.id == self.program_director_id
 
     def has_object_update_permission(self, request):
         return self.has_object_write_permission(request)
@@ -283,9 +347,8 @@ class Slot(BaseUUIDModel):
     """
 
     # Default Min date not used as this can cause issues in some databases and systems
-    DEAFULT_INIT_DATE = datetime.fromisoformat(
-        "2000-01-03 00:00:00"
-    )  # First Monday of the year 2000
+    DEFAULT_INIT_DATE = _SLOT_EPOCH  # First Monday of the year 2000
+    DEAFULT_INIT_DATE = DEFAULT_INIT_DATE  # Old misspelled name, kept for compatibility
     # DO NOT CHANGE THE DEFAULT INIT DATE | USED FOR EASE OF USE
 
     computer = models.ForeignKey(
@@ -293,13 +356,18 @@ class Slot(BaseUUIDModel):
         on_delete=models.PROTECT,
         null=True,
     )
-    language = models.CharField(max_length=254, choices=LanguageChoices)
-    schedule_start = models.DateTimeField(
-        null=False, blank=False
-    )  # All Date Times in UTC
-    schedule_end = models.DateTimeField(
-        null=False, blank=False
-    )  # All Date Times are in UTC
+    program_director = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=True,
+    )  # Denormalized from computer, kept in sync by signals
+    language = models.CharField(
+        max_length=2, choices=Language.choices, default=Language.ENGLISH
+    )
+    schedule = DateTimeRangeField(null=False, blank=False)  # All Date Times in UTC
     start_date = models.DateField(auto_now=True)  # When the slot becomes active
     end_date = models.DateField(null=True, blank=True)  # if and when the slot ends
     event_id = models.CharField(max_length=60, null=True, blank=True)
@@ -311,43 +379,72 @@ class Slot(BaseUUIDModel):
     is_mentor_assigned = models.BooleanField(default=False)
     is_student_assigned = models.BooleanField(default=False)
 
-    def save(self, *args, **kwargs):
-
-        if Slot.objects.filter(
-            computer=self.computer,
-            schedule_end__gt=self.schedule_start,
-            schedule_start__lt=self.schedule_end,
-        ).exists():
-            raise ValidationError({"schedule": "Conflict Found"})
-
-        return super().save(*args, **kwargs)
-
-    def start_day_of_the_week(self):
-        return self.schedule_start.date().weekday()
-
-    def end_day_of_the_week(self):
-        return self.schedule_end.date().weekday()
-
-    def start_hour(self):
-        return self.schedule_start.hour
-
-    def end_hour(self):
-        return self.schedule_end.hour
+    # Derived from schedule on save, week starts with Monday (0)
+    start_day_of_the_week = models.PositiveSmallIntegerField(editable=False)
+    end_day_of_the_week = models.PositiveSmallIntegerField(editable=False)
+    start_hour = models.PositiveSmallIntegerField(editable=False)
+    end_hour = models.PositiveSmallIntegerField(editable=False)
+    start_minute = models.PositiveSmallIntegerField(editable=False)
+    end_minute = models.PositiveSmallIntegerField(editable=False)
+    # Minutes since Monday 00:00 (0 - 10079), for range lookups on the weekly schedule
+    start_minute_of_week = models.PositiveSmallIntegerField(
+        editable=False, db_index=True
+    )
+    end_minute_of_week = models.PositiveSmallIntegerField(editable=False, db_index=True)
 
-    def start_minute(self):
-        return self.schedule_start.minute
+    class Meta:
+        constraints = [
+            # Overlapping schedules on the same computer are rejected by the database,
+            # soft deleted slots are not considered. The constraint is backed by a
+            # GiST index on (computer, schedule) which also serves overlap lookups
+            ExclusionConstraint(
+                name="slot_no_overlap",
+                expressions=[
+                    ("computer", RangeOperators.EQUAL),
+                    ("schedule", RangeOperators.OVERLAPS),
+                ],
+                condition=Q(deleted=False),
+            )
+        ]
+
+    @property
+    def schedule_start(self):
+        return self.schedule.lower
+
+    @property
+    def schedule_end(self):
+        return self.schedule.upper
 
-    def end_minute(self):
-        return self.schedule_end.minute
+    def save(self, *args, **kwargs):
+        self.start_day_of_the_week = self.schedule_start.weekday()
+        self.end_day_of_the_week = self.schedule_end.weekday()
+        self.start_hour = self.schedule_start.hour
+        self.end_hour = self.schedule_end.hour
+        self.start_minute = self.schedule_start.minute
+        self.end_minute = self.schedule_end.minute
+        self.start_minute_of_week = (
+            self.start_day_of_the_week * 24 + self.start_hour
+        ) * 60 + self.start_minute
+        self.end_minute_of_week = (
+            self.end_day_of_the_week * 24 + self.end_hour
+        ) * 60 + self.end_minute
+
+        try:
+            with transaction.atomic():
+                return super().save(*args, **kwargs)
+        except IntegrityError as e:
+            diag = getattr(e.__cause__, "diag", None)
+            if getattr(diag, "constraint_name", None) == "slot_no_overlap":
+                raise ValidationError({"schedule": "Conflict Found"})
+            raise
 
     @staticmethod
     def has_create_permission(request):
-        computer = Computer.objects.get(
-            external_id=request.parser_context["kwargs"]["computer_external_id"]
+        computer = get_by_external_id(
+            Computer, request.parser_context["kwargs"]["computer_external_id"]
         )
         return (
-            request.user.is_superuser
-            or request.user == computer.program.program_director
+            request.user.is_superuser or request.user.id == computer.program_director_id
         )
 
     @staticmethod
@@ -359,10 +456,7 @@ class Slot(BaseUUIDModel):
         return True  # User Queryset Filtering Here
 
     def has_object_write_permission(self, request):
-        return (
-            request.user.is_superuser
-            or request.user == self.computer.program.program_director
-        )
+        return request.user.is_superuser or request.user.id == self.program_director_id
 
     def has_object_update_permission(self, request):
         return self.has_object_write_permission(request)
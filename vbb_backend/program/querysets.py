@@ -0,0 +1,20 @@
+"""
+select_related chains used by the program viewsets, so that serializing a page of objects
+does not lazily fetch related rows one object at a time.
+
+Object permission checks read the program_director_id stored on each row and need no
+joins, only viewsets whose serializers render a relation are listed here.
+"""
+from vbb_backend.program.models import Program, StudentSlotAssociation
+
+PROGRAM_RELATED = ("program_director",)  # ProgramSerializer.program_director_obj
+STUDENT_SLOT_RELATED = ("student",)  # StudentSlotSerializer.student_obj
+
+RELATED = {
+    Program: PROGRAM_RELATED,
+    StudentSlotAssociation: STUDENT_SLOT_RELATED,
+}
+
+
+def get_optimized_queryset(model):
+    return model.objects.select_related(*RELATED[model])
@@ -0,0 +1,127 @@
+"""
+School, Classroom, Computer and Slot carry a denormalized copy of the program director
+so that object permission checks do not have to walk back up to the Program.
+
+The copy is read from the parent on every save, and pushed down to the children only
+when the director of a Program, School or Computer differs from its loaded value.
+
+Program, School and Computer are also cached by external_id (see vbb_backend.program.cache),
+cached entries are invalidated once the transaction that changed the row commits.
+"""
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from vbb_backend.program import cache
+from vbb_backend.program.models import Classroom, Computer, Program, School, Slot
+
+TRACKED_FIELDS = {
+    Program: ("program_director_id",),
+    School: ("program_director_id",),
+    Computer: ("program_director_id",),
+}
+
+
+def remember_tracked_fields(instance):
+    # Read from __dict__ so deferred fields are not fetched
+    instance._tracked_fields = {
+        field: instance.__dict__.get(field) for field in TRACKED_FIELDS[type(instance)]
+    }
+
+
+def has_changed(instance, field):
+    if instance._state.adding:
+        return True
+    return instance._tracked_fields.get(field) != instance.__dict__.get(field)
+
+
+def get_program_director_id(model, pk):
+    # Read on every save, a stale copy loaded before a director change must not be written back
+    if pk is None:
+        return None
+    return (
+        model._base_manager.filter(pk=pk)
+        .values_list("program_director_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_init, sender=Program)
+@receiver(post_init, sender=School)
+@receiver(post_init, sender=Computer)
+def track_fields(sender, instance, **kwargs):
+    remember_tracked_fields(instance)
+
+
+@receiver(pre_save, sender=School)
+@receiver(pre_save, sender=Computer)
+def set_program_director_from_program(sender, instance, **kwargs):
+    instance.program_director_id = get_program_director_id(Program, instance.program_id)
+
+
+@receiver(pre_save, sender=Classroom)
+def set_program_director_from_school(sender, instance, **kwargs):
+    instance.program_director_id = get_program_director_id(School, instance.school_id)
+
+
+@receiver(pre_save, sender=Slot)
+def set_program_director_from_computer(sender, instance, **kwargs):
+    instance.program_director_id = get_program_director_id(
+        Computer, instance.computer_id
+    )
+
+
+@receiver(post_save, sender=Program)
+def sync_program_director(sender, instance, created, **kwargs):
+    if created or not has_changed(instance, "program_director_id"):
+        return
+    director_id = instance.program_director_id
+    schools = School.objects.filter(program=instance)
+    computers = Computer.objects.filter(program=instance)
+    # update() skips the signals below, drop the cached children with the old director
+    cache.invalidate(School, *schools.values_list("external_id", flat=True))
+    cache.invalidate(Computer, *computers.values_list("external_id", flat=True))
+
+    schools.update(program_director_id=director_id)
+    Classroom.objects.filter(school__program=instance).update(
+        program_director_id=director_id
+    )
+    computers.update(program_director_id=director_id)
+    Slot.objects.filter(computer__program=instance).update(
+        program_director_id=director_id
+    )
+
+
+@receiver(post_save, sender=School)
+def sync_school_program_director(sender, instance, created, **kwargs):
+    if created or not has_changed(instance, "program_director_id"):
+        return
+    Classroom.objects.filter(school=instance).update(
+        program_director_id=instance.program_director_id
+    )
+
+
+@receiver(post_save, sender=Computer)
+def sync_computer_program_director(sender, instance, created, **kwargs):
+    if created or not has_changed(instance, "program_director_id"):
+        return
+    Slot.objects.filter(computer=instance).update(
+        program_director_id=instance.program_director_id
+    )
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_save, sender=School)
+@receiver(post_save, sender=Computer)
+@receiver(post_delete, sender=Program)
+@receiver(post_delete, sender=School)
+@receiver(post_delete, sender=Computer)
+def invalidate_cached_object(sender, instance, **kwargs):
+    cache.invalidate(sender, instance.external_id)
+
+
+# Connected last so the receivers above still compare against the loaded values
+@receiver(post_save, sender=Program)
+@receiver(post_save, sender=School)
+@receiver(post_save, sender=Computer)
+def refresh_tracked_fields(sender, instance, **kwargs):
+    remember_tracked_fields(instance)
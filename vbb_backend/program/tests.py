@@ -1,3 +1,198 @@
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from psycopg2.extras import DateTimeTZRange
+from rest_framework.exceptions import ValidationError
+
+from vbb_backend.program.cache import get_by_external_id, get_cache_key, get_version
+from vbb_backend.program.models import Classroom, Computer, Program, School, Slot
+from vbb_backend.users.models import User
+
+
+def create_user(username):
+    return User.objects.create(username=username, time_zone="UTC")
+
+
+def create_program(director):
+    return Program.objects.create(
+        name="Program", time_zone="UTC", program_director=director
+    )
+
+
+def create_school(program):
+    return School.objects.create(
+        name="School", program=program, longitude=0, latitude=0
+    )
+
+
+def create_schedule(start_hour, end_hour):
+    day = datetime(2000, 1, 3, tzinfo=timezone.utc)
+    return DateTimeTZRange(
+        day + timedelta(hours=start_hour), day + timedelta(hours=end_hour)
+    )
+
+
+# TransactionTestCase so that the on_commit cache invalidation runs
+class ProgramDirectorTestCase(TransactionTestCase):
+    def setUp(self):
+        self.director = create_user("director")
+        self.program = create_program(self.director)
+        self.school = create_school(self.program)
+        self.classroom = Classroom.objects.create(school=self.school)
+        self.computer = Computer.objects.create(program=self.program)
+        self.slot = Slot.objects.create(
+            computer=self.computer, schedule=create_schedule(9, 10)
+        )
+
+    def assertProgramDirector(self, director):
+        for obj in (self.school, self.classroom, self.computer, self.slot):
+            obj.refresh_from_db()
+            self.assertEqual(obj.program_director_id, director.id, obj)
+
+    def test_copied_on_create(self):
+        self.assertProgramDirector(self.director)
+
+    def test_program_director_change_propagates(self):
+        new_director = create_user("new_director")
+        self.program.program_director = new_director
+        self.program.save()
+
+        self.assertProgramDirector(new_director)
+
+    def test_stale_instance_does_not_restore_old_director(self):
+        school = School.objects.get(pk=self.school.pk)
+        new_director = create_user("new_director")
+        self.program.program_director = new_director
+        self.program.save()
+
+        school.name = "Renamed"
+        school.save()
+
+        self.assertProgramDirector(new_director)
+
+    def test_school_moved_to_other_program(self):
+        other_director = create_user("other_director")
+        other_program = create_program(other_director)
+        self.school.program = other_program
+        self.school.save()
+
+        self.school.refresh_from_db()
+        self.classroom.refresh_from_db()
+        self.assertEqual(self.school.program_director_id, other_director.id)
+        self.assertEqual(self.classroom.program_director_id, other_director.id)
+
+    def test_computer_moved_to_other_program(self):
+        other_director = create_user("other_director")
+        other_program = create_program(other_director)
+        self.computer.program = other_program
+        self.computer.save()
+
+        self.computer.refresh_from_db()
+        self.slot.refresh_from_db()
+        self.assertEqual(self.computer.program_director_id, other_director.id)
+        self.assertEqual(self.slot.program_director_id, other_director.id)
+
+
+class ExternalIdCacheTestCase(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.program = create_program(create_user("director"))
+        self.school = create_school(self.program)
+        self.computer = Computer.objects.create(program=self.program)
+
+    def test_program_director_change_drops_cached_children(self):
+        for obj in (self.school, self.computer):
+            get_by_external_id(type(obj), obj.external_id)
+
+        new_director = create_user("new_director")
+        self.program.program_director = new_director
+        self.program.save()
+
+        for obj in (self.school, self.computer):
+            cached = get_by_external_id(type(obj), obj.external_id)
+            self.assertEqual(cached.program_director_id, new_director.id, obj)
+
+    def test_late_set_after_invalidation_is_not_served(self):
+        # A lookup that read the row before the director change committed
+        key = get_cache_key(School, self.school.external_id)
+        version = get_version(key)
+        stale = School.objects.get(pk=self.school.pk)
+
+        new_director = create_user("new_director")
+        self.program.program_director = new_director
+        self.program.save()
+        cache.set(f"{key}:{version}", stale)
+
+        cached = get_by_external_id(School, self.school.external_id)
+        self.assertEqual(cached.program_director_id, new_director.id)
+
+
+class SlotOverlapTestCase(TransactionTestCase):
+    def setUp(self):
+        program = create_program(create_user("director"))
+        self.computer = Computer.objects.create(program=program)
+        self.slot = Slot.objects.create(
+            computer=self.computer, schedule=create_schedule(9, 10)
+        )
+
+    def test_overlapping_slot_is_rejected(self):
+        with self.assertRaises(ValidationError) as error:
+            Slot.objects.create(computer=self.computer, schedule=create_schedule(9, 11))
+        self.assertIn("schedule", error.exception.detail)
+
+    def test_adjacent_slot_is_allowed(self):
+        Slot.objects.create(computer=self.computer, schedule=create_schedule(10, 11))
+
+    def test_deleted_slot_does_not_conflict(self):
+        self.slot.delete()
+        Slot.objects.create(computer=self.computer, schedule=create_schedule(9, 10))
+
+
+class SlotScheduleRangeMigrationTestCase(TransactionTestCase):
+    migrate_from = [("program", "0013_book_isbn_char")]
+    migrate_to = [("program", "0014_slot_schedule_range")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        # Back to the latest state for the other test cases
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_migrates_and_reverses_with_rows(self):
+        apps = self.migrate(self.migrate_from)
+        Program = apps.get_model("program", "Program")
+        Computer = apps.get_model("program", "Computer")
+        Slot = apps.get_model("program", "Slot")
+        schedule = create_schedule(9, 10)
+        start, end = schedule.lower, schedule.upper
+        computer = Computer.objects.create(
+            program=Program.objects.create(name="Program", time_zone="UTC")
+        )
+        slot = Slot.objects.create(
+            computer=computer,
+            schedule_start=start,
+            schedule_end=end,
+            start_day_of_the_week=start.weekday(),
+            end_day_of_the_week=end.weekday(),
+            start_hour=start.hour,
+            end_hour=end.hour,
+            start_minute=start.minute,
+            end_minute=end.minute,
+        )
+
+        apps = self.migrate(self.migrate_to)
+        migrated = apps.get_model("program", "Slot").objects.get(pk=slot.pk)
+        self.assertEqual(migrated.schedule.lower, start)
+        self.assertEqual(migrated.schedule.upper, end)
+
+        apps = self.migrate(self.migrate_from)
+        reversed_slot = apps.get_model("program", "Slot").objects.get(pk=slot.pk)
+        self.assertEqual(reversed_slot.schedule_start, start)
+        self.assertEqual(reversed_slot.schedule_end, end)
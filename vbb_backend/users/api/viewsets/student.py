@@ -26,9 +26,7 @@ class StudentViewSet(ModelViewSet):
         if user.is_superuser:
             pass
         elif user.user_type in [UserTypeEnum.HEADMASTER.value]:
-            queryset = queryset.filter(
-                classroom__school__program__program_director=user
-            )
+            queryset = queryset.filter(classroom__program_director=user)
         else:
             raise PermissionDenied()
         return queryset
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_auto_20210111_1749'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='primary_language',
+            field=models.CharField(choices=[('ENGLISH', 'English')], max_length=254),
+        ),
+    ]
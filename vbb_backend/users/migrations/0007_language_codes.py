@@ -0,0 +1,29 @@
+# Generated by Django 3.0.10 on 2026-10-14 08:27
+
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    User.objects.filter(primary_language="ENGLISH").update(primary_language="EN")
+
+
+def backwards(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    User.objects.filter(primary_language="EN").update(primary_language="ENGLISH")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_language_choices'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+        migrations.AlterField(
+            model_name='user',
+            name='primary_language',
+            field=models.CharField(choices=[('EN', 'English')], default='EN', max_length=2),
+        ),
+    ]
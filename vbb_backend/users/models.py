@@ -21,7 +21,8 @@ class UserTypeEnum(enum.Enum):
 
 UserTypeChoices = [(e.value, e.name) for e in UserTypeEnum]
 
-from vbb_backend.program.models import Classroom, School, LanguageChoices, TIMEZONES
+from vbb_backend.program.cache import get_by_external_id
+from vbb_backend.program.models import Classroom, School, Language, TIMEZONES
 
 
 class User(AbstractUser, BaseUUIDModel):
@@ -50,7 +51,9 @@ class User(AbstractUser, BaseUUIDModel):
         max_length=40, null=True, blank=True, verbose_name=_("VBB Chapter")
     )
     date_of_birth = models.DateField(blank=True, null=True)
-    primary_language = models.CharField(max_length=254, choices=LanguageChoices)
+    primary_language = models.CharField(
+        max_length=2, choices=Language.choices, default=Language.ENGLISH
+    )
     time_zone = models.CharField(max_length=32, choices=TIMEZONES)
 
     initials = models.CharField(max_length=6, null=True)
@@ -112,11 +115,11 @@ class Student(BaseUUIDModel):
 
     @staticmethod
     def has_create_permission(request):
-        school = School.objects.get(
-            external_id=request.parser_context["kwargs"]["school_external_id"]
+        school = get_by_external_id(
+            School, request.parser_context["kwargs"]["school_external_id"]
         )
         return (
-            request.user.is_superuser or request.user == school.program.program_director
+            request.user.is_superuser or request.user.id == school.program_director_id
         )
 
     @staticmethod
@@ -130,7 +133,7 @@ class Student(BaseUUIDModel):
     def has_object_write_permission(self, request):
         return (
             request.user.is_superuser
-            or request.user == self.classroom.school.program.program_director
+            or request.user.id == self.classroom.program_director_id
         )
 
     def has_object_update_permission(self, request):